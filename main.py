@@ -1,16 +1,21 @@
 
 # narcan_finder_simulated.py
 
-import os, json, secrets, sqlite3, asyncio, threading
+import os, csv, json, logging, queue, random, secrets, sqlite3, asyncio, threading, atexit, time
+import concurrent.futures, functools, multiprocessing
 from datetime import datetime
+from pathlib import Path
+from contextlib import contextmanager
+from concurrent.futures.process import BrokenProcessPool
 import tkinter as tk
 import tkinter.simpledialog as sd
 import tkinter.filedialog as fd
-import psutil, httpx, numpy as np
+import psutil, httpx, orjson, numpy as np
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
 import pennylane as qml
 
 # Paths
@@ -22,121 +27,287 @@ EXPORT_PATH = os.path.expanduser("~/narcan_exports")
 
 # ─────────────────────────────────────────────────────────────
 def derive_key(password: bytes, salt: bytes) -> bytes:
+    return HKDF(
+        algorithm=hashes.SHA256(), length=32, salt=salt, info=b"narcan-api-key"
+    ).derive(password)
+
+def _derive_legacy_key(password: bytes, salt: bytes) -> bytes:
+    # Key derivation used before HKDF; only kept to migrate existing API-key files.
     return PBKDF2HMAC(
-        algorithm=hashes.SHA256(), length=32, salt=salt,
-        iterations=480_000, backend=default_backend()
+        algorithm=hashes.SHA256(), length=32, salt=salt, iterations=480_000
     ).derive(password)
 
+def _load_or_create_secret(path: str, size: int) -> bytes:
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        secret = secrets.token_bytes(size)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_bytes(secret)
+        return secret
+
 def load_or_create_salt() -> bytes:
-    if os.path.exists(SALT_FILE):
-        return open(SALT_FILE, "rb").read()
-    salt = secrets.token_bytes(16)
-    os.makedirs(os.path.dirname(SALT_FILE), exist_ok=True)
-    with open(SALT_FILE, "wb") as f: f.write(salt)
-    return salt
+    return _load_or_create_secret(SALT_FILE, 16)
 
 def load_or_create_password() -> bytes:
-    if os.path.exists(KEY_FILE):
-        return open(KEY_FILE, "rb").read()
-    pwd = secrets.token_bytes(32)
-    os.makedirs(os.path.dirname(KEY_FILE), exist_ok=True)
-    with open(KEY_FILE, "wb") as f: f.write(pwd)
-    return pwd
+    return _load_or_create_secret(KEY_FILE, 32)
+
+@functools.lru_cache(maxsize=1)
+def _aesgcm() -> AESGCM:
+    return AESGCM(derive_key(load_or_create_password(), load_or_create_salt()))
 
 def encrypt_api_key(api_key: str):
-    key = derive_key(load_or_create_password(), load_or_create_salt())
-    aesgcm = AESGCM(key)
     nonce = secrets.token_bytes(12)
-    with open(ENC_API_FILE, "wb") as f:
-        f.write(nonce + aesgcm.encrypt(nonce, api_key.encode(), None))
+    Path(ENC_API_FILE).write_bytes(nonce + _aesgcm().encrypt(nonce, api_key.encode(), None))
 
 def decrypt_api_key() -> str:
-    key = derive_key(load_or_create_password(), load_or_create_salt())
-    with open(ENC_API_FILE, "rb") as f:
-        raw = f.read()
-    return AESGCM(key).decrypt(raw[:12], raw[12:], None).decode()
+    raw = Path(ENC_API_FILE).read_bytes()
+    try:
+        return _aesgcm().decrypt(raw[:12], raw[12:], None).decode()
+    except InvalidTag:
+        legacy = AESGCM(_derive_legacy_key(load_or_create_password(), load_or_create_salt()))
+        api_key = legacy.decrypt(raw[:12], raw[12:], None).decode()
+        encrypt_api_key(api_key)
+        return api_key
 
 # ─────────────────────────────────────────────────────────────
+_USAGE_TTL = 0.5
+_last_usage = [float("-inf"), (0.0, 0.0)]
+psutil.cpu_percent(None)  # prime the counter so the first real reading isn't 0.0
+
 def get_cpu_ram_usage():
-    return psutil.cpu_percent(), psutil.virtual_memory().percent
+    now = time.monotonic()
+    if now - _last_usage[0] < _USAGE_TTL:
+        return _last_usage[1]
+    usage = (psutil.cpu_percent(None), psutil.virtual_memory().percent)
+    _last_usage[0], _last_usage[1] = now, usage
+    return usage
+
+_DEV = qml.device("lightning.qubit", wires=7)
+_H_OBS = qml.Hermitian(np.array([[1, 1j], [-1j, 1]]), wires=6)
+_I = np.arange(7, dtype=np.float64)
+
+@qml.qnode(_DEV, interface=None, diff_method=None)
+def _circuit(cpu_param, ram_param, hybrid):
+    qml.AngleEmbedding(np.pi * (cpu_param + _I * 0.01), wires=range(7), rotation="X")
+    qml.AngleEmbedding(np.pi * (ram_param + _I * 0.01), wires=range(7), rotation="Y")
+    qml.AngleEmbedding(np.pi * (hybrid + _I * 0.02), wires=range(7), rotation="Z")
+    for i in range(6): qml.CNOT(wires=[i, i + 1])
+    qml.CNOT(wires=[0, 6])
+    qml.CZ(wires=[2, 5])
+    qml.CRZ(np.pi * hybrid, wires=[1, 4])
+    qml.Rot(np.pi * cpu_param, np.pi * ram_param, np.pi * hybrid, wires=3)
+    qml.Rot(np.pi * ram_param, np.pi * hybrid, np.pi * cpu_param, wires=4)
+    return [
+        qml.expval(qml.PauliZ(0) @ qml.PauliZ(1)),
+        qml.expval(qml.PauliX(2) @ qml.PauliX(3)),
+        qml.expval(qml.PauliY(4) @ qml.PauliY(5)),
+        qml.expval(_H_OBS)
+    ]
 
 def run_quantum_analysis(cpu, ram):
-    cpu_param = cpu / 100
-    ram_param = ram / 100
-    hybrid = (cpu_param + ram_param) / 2
-    dev = qml.device("default.qubit", wires=7)
-
-    @qml.qnode(dev)
-    def circuit(cpu_param, ram_param, hybrid):
-        for i in range(7):
-            qml.RX(np.pi * (cpu_param + i * 0.01), wires=i)
-            qml.RY(np.pi * (ram_param + i * 0.01), wires=i)
-            qml.RZ(np.pi * (hybrid + i * 0.02), wires=i)
-        for i in range(6): qml.CNOT(wires=[i, i + 1])
-        qml.CNOT(wires=[0, 6])
-        qml.CZ(wires=[2, 5])
-        qml.CRZ(np.pi * hybrid, wires=[1, 4])
-        qml.Rot(np.pi * cpu_param, np.pi * ram_param, np.pi * hybrid, wires=3)
-        qml.Rot(np.pi * ram_param, np.pi * hybrid, np.pi * cpu_param, wires=4)
-        return [
-            qml.expval(qml.PauliZ(0) @ qml.PauliZ(1)),
-            qml.expval(qml.PauliX(2) @ qml.PauliX(3)),
-            qml.expval(qml.PauliY(4) @ qml.PauliY(5)),
-            qml.expval(qml.Hermitian(np.array([[1, 1j], [-1j, 1]]), wires=6))
-        ]
-
     try:
-        return [round(float(x), 4) for x in circuit(cpu_param, ram_param, hybrid)]
+        return [round(float(x), 4) for x in _circuit(cpu / 100, ram / 100, (cpu + ram) / 200)]
     except:
         return [0.0, 0.0, 0.0, 0.0]
 
+async def sample_system_signals(executor=None):
+    cpu, ram = get_cpu_ram_usage()
+    quantum = await asyncio.get_running_loop().run_in_executor(executor, run_quantum_analysis, cpu, ram)
+    return cpu, ram, quantum
+
 # ─────────────────────────────────────────────────────────────
+_CLIENT = None
+
+def _client() -> httpx.AsyncClient:
+    # Created lazily on the app's single background loop and reused for its lifetime.
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(20.0, connect=5.0), http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+        )
+    return _CLIENT
+
+async def close_client():
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+
 async def run_openai_completion(prompt: str, api_key: str):
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-        data = {
-            "model": "gpt-4o",
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.7
-        }
-        for _ in range(3):
-            try:
-                res = await client.post("https://api.openai.com/v1/chat/completions", json=data, headers=headers)
-                res.raise_for_status()
-                return res.json()["choices"][0]["message"]["content"].strip()
-            except:
-                await asyncio.sleep(1)
-        return None
+    client = _client()
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    data = {
+        "model": "gpt-4o",
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.7
+    }
+    for attempt in range(3):
+        try:
+            res = await client.post("https://api.openai.com/v1/chat/completions", json=data, headers=headers)
+            res.raise_for_status()
+            return res.json()["choices"][0]["message"]["content"].strip()
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status < 500 and status != 429:
+                return None
+        except httpx.RequestError:
+            pass
+        except (KeyError, IndexError, ValueError):
+            return None
+        if attempt < 2:
+            await asyncio.sleep(min(1.0, 0.2 * 2 ** attempt) + random.random() * 0.1)
+    return None
 
 # ─────────────────────────────────────────────────────────────
+_DB = None
+_DB_LOCK = threading.RLock()
+
+def db():
+    global _DB
+    with _DB_LOCK:
+        if _DB is None:
+            conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            _DB = conn
+        return _DB
+
+atexit.register(lambda: _DB and _DB.close())
+
+@contextmanager
+def tx():
+    with _DB_LOCK:
+        conn = db()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except:
+            conn.execute("ROLLBACK")
+            raise
+
+_WQ = queue.Queue()
+_writer_thread = None
+
+def _writer():
+    while True:
+        batch = [_WQ.get()]
+        while True:
+            try:
+                batch.append(_WQ.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            for attempt in range(3):
+                try:
+                    save_many_to_db(batch)
+                    break
+                except sqlite3.Error:
+                    if attempt == 2:
+                        logging.exception("Dropped %d triage record(s) after 3 failed writes", len(batch))
+                    else:
+                        time.sleep(0.5 * 2 ** attempt)
+        finally:
+            for _ in batch: _WQ.task_done()
+
 def setup_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS narcan_requests (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_input TEXT NOT NULL,
-            ai_response TEXT NOT NULL
-        )""")
-    conn.commit()
-    conn.close()
+    global _writer_thread
+    with _DB_LOCK:
+        db().execute("""
+            CREATE TABLE IF NOT EXISTS narcan_requests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_input TEXT NOT NULL,
+                ai_response TEXT NOT NULL
+            )""")
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer, daemon=True)
+            _writer_thread.start()
+            atexit.register(_WQ.join)
+
+def save_many_to_db(rows):
+    with tx() as c:
+        c.executemany("INSERT INTO narcan_requests (user_input, ai_response) VALUES (?, ?)", rows)
 
 def save_to_db(prompt: str, result: str):
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("INSERT INTO narcan_requests (user_input, ai_response) VALUES (?, ?)", (prompt, result))
-    conn.commit()
-    conn.close()
-
-def export_latest_txt():
+    _WQ.put((prompt, result))
+
+def _write_txt(f, rows):
+    for r in rows:
+        f.write(f"--- ID {r[0]} ---\nUSER:\n{r[1]}\n\nAI:\n{r[2]}\n{'='*50}\n\n")
+
+def _write_csv(f, rows):
+    writer = csv.writer(f)
+    writer.writerow(["id", "user_input", "ai_response"])
+    writer.writerows(rows)
+
+def _write_json(f, rows):
+    # Streams the same bytes as orjson.dumps(list_of_rows, option=OPT_INDENT_2).
+    f.write(b"[")
+    sep = b"\n  "
+    for r in rows:
+        f.write(sep)
+        f.write(orjson.dumps({"id": r[0], "user_input": r[1], "ai_response": r[2]}, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+        sep = b",\n  "
+    f.write(b"]" if sep == b"\n  " else b"\n]")
+
+_EXPORT_FORMATS = {
+    "txt": (_write_txt, {"mode": "w", "encoding": "utf-8"}),
+    "csv": (_write_csv, {"mode": "w", "encoding": "utf-8", "newline": ""}),
+    "json": (_write_json, {"mode": "wb"}),
+}
+
+def _export(fmt: str):
+    write_rows, open_kw = _EXPORT_FORMATS[fmt]
+    _WQ.join()
     os.makedirs(EXPORT_PATH, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    rows = conn.execute("SELECT * FROM narcan_requests ORDER BY id DESC LIMIT 10").fetchall()
-    conn.close()
-    path = os.path.join(EXPORT_PATH, f"narcan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-    with open(path, "w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(f"--- ID {r[0]} ---\nUSER:\n{r[1]}\n\nAI:\n{r[2]}\n{'='*50}\n\n")
+    path = os.path.join(EXPORT_PATH, f"narcan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}")
+    with _DB_LOCK, open(path, **open_kw) as f:
+        write_rows(f, db().execute("SELECT id, user_input, ai_response FROM narcan_requests ORDER BY id DESC LIMIT 10"))
     return path
 
+def export_latest_txt():
+    return _export("txt")
+
+def export_latest_csv():
+    return _export("csv")
+
+def export_latest_json():
+    return _export("json")
+
+# ─────────────────────────────────────────────────────────────
+_PROMPT = """
+[System Activated: HyperTOM-SIM Engine]
+
+You are a real-time AI triage system. The user has initiated an emergency simulation. Evaluate this as a real-life opioid overdose event using the following context.
+
+🧍 USER CONTEXT
+- Location: {location}
+- Physical Symptoms: {symptoms}
+- User-Simulated Situation: {simulation}
+
+🖥️ SYSTEM SIGNALS
+- CPU: {cpu:.2f}%
+- RAM: {ram:.2f}%
+- Quantum Vector:
+    QZ: {q0}
+    QX: {q1}
+    QY: {q2}
+    Entropy: {q3}
+
+Return a 3-TIER life-saving triage response:
+
+🚨 Tier 1: Closest NARCAN pickup (address, hours, phone)
+🛟 Tier 2: Outreach, kits, vans, peer support
+🧠 Tier 3: Solo survival guide (airways, timing, emergency override, what to tell 911)
+
+Respond with empathy, precision, and save lives.
+
+[End Simulation]
+"""
+
 # ─────────────────────────────────────────────────────────────
 class NarcanFinderApp(tk.Tk):
     def __init__(self):
@@ -144,7 +315,16 @@ class NarcanFinderApp(tk.Tk):
         self.title("Quantum NARCAN Finder (HyperTOM)")
         self.geometry("1050x1000")
         setup_db()
+        self._pool_lock = threading.Lock()
+        self._pool = self._new_pool()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._signals_lock = threading.RLock()
+        self._signals, self._signals_at = None, float("-inf")
+        self._ui_queue = queue.Queue()
         self._init_ui()
+        self._drain_ui()
 
     def _init_ui(self):
         font_h = ("Helvetica", 18, "bold")
@@ -164,78 +344,131 @@ class NarcanFinderApp(tk.Tk):
         self.simulation_entry = tk.Entry(self, font=font_b, width=70)
         self.simulation_entry.pack()
 
-        tk.Button(self, text="🚨 Run Triage", font=font_b, command=self._start_thread).pack(pady=10)
+        run_button = tk.Button(self, text="🚨 Run Triage", font=font_b, command=self._start_thread)
+        run_button.bind("<Enter>", self._prefetch_signals)
+        run_button.bind("<FocusIn>", self._prefetch_signals)
+        run_button.pack(pady=10)
 
         self.text = tk.Text(self, width=120, height=40, font=("Courier", 11))
         self.text.pack()
 
         menu = tk.Menu(self)
         menu.add_command(label="🔐 Set API Key", command=self._set_key)
-        menu.add_command(label="📄 Export TXT", command=self._export_txt)
+        menu.add_command(label="📄 Export TXT", command=lambda: self._export("txt"))
+        menu.add_command(label="📊 Export CSV", command=lambda: self._export("csv"))
+        menu.add_command(label="🧾 Export JSON", command=lambda: self._export("json"))
         self.config(menu=menu)
 
     def _set_key(self):
         key = sd.askstring("OpenAI API Key", "Enter your key:", show="*")
         if key: encrypt_api_key(key)
 
-    def _start_thread(self):
-        threading.Thread(target=self._process_request, daemon=True).start()
+    def _new_pool(self):
+        # One worker: at most one circuit job is ever outstanding. forkserver avoids
+        # forking this process after the loop thread and Tk are already running.
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context(method))
+        pool.submit(run_quantum_analysis, 0.0, 0.0)  # warm the worker so the first triage doesn't pay for its startup
+        return pool
+
+    def _replace_pool(self, broken):
+        with self._pool_lock:
+            if self._pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._pool = self._new_pool()
+
+    def _prefetch_signals(self, _event=None):
+        # Start sampling as the user reaches for the button. A pending sample is always reused;
+        # a finished one only while it is younger than _USAGE_TTL.
+        with self._signals_lock:
+            fut = self._signals
+            if fut is None or (fut.done() and time.monotonic() - self._signals_at > _USAGE_TTL):
+                fut = asyncio.run_coroutine_threadsafe(sample_system_signals(self._pool), self._loop)
+                self._signals = fut
+                fut.add_done_callback(self._stamp_signals)
+            return fut
+
+    def _stamp_signals(self, fut):
+        with self._signals_lock:
+            if self._signals is fut:
+                self._signals_at = time.monotonic()
+
+    def _discard_signals(self, fut):
+        with self._signals_lock:
+            if self._signals is fut:
+                self._signals = None
+
+    def _ui(self, fn, *args):
+        # Worker threads never touch Tcl; the main thread applies queued updates in _drain_ui.
+        self._ui_queue.put((fn, args))
+
+    def _drain_ui(self):
+        while True:
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args)
+        self.after(30, self._drain_ui)
 
-    def _process_request(self):
+    def _start_thread(self):
         self.text.delete("1.0", tk.END)
         location = self.location_entry.get().strip()
         symptoms = self.symptom_entry.get().strip()
         simulation = self.simulation_entry.get().strip()
+        threading.Thread(target=self._process_request, args=(location, symptoms, simulation), daemon=True).start()
+
+    def _process_request(self, location, symptoms, simulation):
         try:
             api_key = decrypt_api_key()
         except:
-            self.text.insert(tk.END, "❌ API key error.\n")
+            self._ui(self.text.insert, tk.END, "❌ API key error.\n")
             return
 
-        cpu, ram = get_cpu_ram_usage()
-        quantum = run_quantum_analysis(cpu, ram)
-
-        prompt = f"""
-[System Activated: HyperTOM-SIM Engine]
-
-You are a real-time AI triage system. The user has initiated an emergency simulation. Evaluate this as a real-life opioid overdose event using the following context.
-
-🧍 USER CONTEXT
-- Location: {location}
-- Physical Symptoms: {symptoms}
-- User-Simulated Situation: {simulation}
-
-🖥️ SYSTEM SIGNALS
-- CPU: {cpu:.2f}%
-- RAM: {ram:.2f}%
-- Quantum Vector:
-    QZ: {quantum[0]}
-    QX: {quantum[1]}
-    QY: {quantum[2]}
-    Entropy: {quantum[3]}
-
-Return a 3-TIER life-saving triage response:
-
-🚨 Tier 1: Closest NARCAN pickup (address, hours, phone)
-🛟 Tier 2: Outreach, kits, vans, peer support
-🧠 Tier 3: Solo survival guide (airways, timing, emergency override, what to tell 911)
-
-Respond with empathy, precision, and save lives.
-
-[End Simulation]
-"""
-
-        self.text.insert(tk.END, "🧠 Running HyperTOM Simulation...\n")
-        result = asyncio.run(run_openai_completion(prompt, api_key))
+        pool = self._pool
+        signals = self._prefetch_signals()
+        try:
+            cpu, ram, quantum = signals.result(timeout=10)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                self._replace_pool(pool)
+            self._discard_signals(signals)
+            cpu, ram = get_cpu_ram_usage()
+            quantum = [0.0, 0.0, 0.0, 0.0]
+
+        prompt = _PROMPT.format_map(dict(
+            location=location, symptoms=symptoms, simulation=simulation, cpu=cpu, ram=ram,
+            q0=quantum[0], q1=quantum[1], q2=quantum[2], q3=quantum[3]
+        ))
+
+        self._ui(self.text.insert, tk.END, "🧠 Running HyperTOM Simulation...\n")
+        fut = asyncio.run_coroutine_threadsafe(run_openai_completion(prompt, api_key), self._loop)
+        try:
+            result = fut.result(timeout=25)
+        except Exception:
+            fut.cancel()
+            result = None
         if result:
-            self.text.insert(tk.END, result)
+            self._ui(self.text.insert, tk.END, result)
             save_to_db(prompt, result)
         else:
-            self.text.insert(tk.END, "\n❌ Failed to retrieve AI response.\n")
+            self._ui(self.text.insert, tk.END, "\n❌ Failed to retrieve AI response.\n")
 
-    def _export_txt(self):
-        path = export_latest_txt()
-        self.text.insert(tk.END, f"\n✅ Exported to:\n{path}\n")
+    def _on_close(self):
+        try:
+            asyncio.run_coroutine_threadsafe(close_client(), self._loop).result(timeout=2)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _export(self, fmt):
+        threading.Thread(target=self._export_worker, args=(fmt,), daemon=True).start()
+
+    def _export_worker(self, fmt):
+        path = _export(fmt)
+        self._ui(self.text.insert, tk.END, f"\n✅ Exported to:\n{path}\n")
 
 # ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":